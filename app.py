@@ -112,45 +112,70 @@ with col3:
     st.metric("Avg Server Utilization", f"{current_util*100:.1f}%")
 
 # ------------------ Time-Series Visualization ------------------
-# Create a Plotly figure to show how metrics evolve over time
-fig = go.Figure()
-
-# Add queue length trace (blue line)
-fig.add_trace(go.Scatter(
-    x=sim.time_history,  # X-axis: simulation time points
-    y=sim.queue_length_history,  # Y-axis: queue length at each time point
-    mode="lines", 
-    name="Queue Length", 
-    line=dict(color="royalblue")
-))
-
-# Add instantaneous utilization trace (green dotted line)
-fig.add_trace(go.Scatter(
-    x=sim.time_history,  # X-axis: simulation time points
-    y=sim.utilization_history,  # Y-axis: utilization at each time point
-    mode="lines", 
-    name="Instantaneous Utilization", 
-    line=dict(color="green", dash="dot")
-))
-
-# Add cumulative utilization trace if available (red line)
-if hasattr(sim, "cumulative_utilization_history"):
+# Upper bound on points sent per trace; longer histories are downsampled
+MAX_PLOT_POINTS = 500
+
+def downsample(history, stride):
+    """Keep every stride-th point of a history list, plus the most recent one"""
+    sampled = history[::stride]
+    if history and (len(history) - 1) % stride:
+        sampled.append(history[-1])  # Always plot up to the current time
+    return sampled
+
+def build_figure(sim):
+    """Create a Plotly figure showing how metrics evolve over time"""
+    fig = go.Figure()
+
+    # Cap the payload per rerun so frame time doesn't grow with simulation length
+    stride = max(1, len(sim.time_history) // MAX_PLOT_POINTS)
+    times = downsample(sim.time_history, stride)
+
+    # Add queue length trace (blue line)
     fig.add_trace(go.Scatter(
-        x=sim.time_history,  # X-axis: simulation time points
-        y=sim.cumulative_utilization_history,  # Y-axis: cumulative average utilization
+        x=times,  # X-axis: simulation time points
+        y=downsample(sim.queue_length_history, stride),  # Y-axis: queue length at each time point
         mode="lines", 
-        name="Cumulative Utilization", 
-        line=dict(color="firebrick")
+        name="Queue Length", 
+        line=dict(color="royalblue")
     ))
 
-# Configure the chart layout
-fig.update_layout(
-    title="System Metrics Over Time",
-    xaxis_title="Time",
-    yaxis_title="Value",
-    template="plotly_white",  # Clean, white background theme
-    legend=dict(x=0, y=1.1, orientation="h")  # Horizontal legend at top
-)
+    # Add instantaneous utilization trace (green dotted line)
+    fig.add_trace(go.Scatter(
+        x=times,  # X-axis: simulation time points
+        y=downsample(sim.utilization_history, stride),  # Y-axis: utilization at each time point
+        mode="lines", 
+        name="Instantaneous Utilization", 
+        line=dict(color="green", dash="dot")
+    ))
+
+    # Add cumulative utilization trace if available (red line)
+    if hasattr(sim, "cumulative_utilization_history"):
+        fig.add_trace(go.Scatter(
+            x=times,  # X-axis: simulation time points
+            y=downsample(sim.cumulative_utilization_history, stride),  # Y-axis: cumulative average utilization
+            mode="lines", 
+            name="Cumulative Utilization", 
+            line=dict(color="firebrick")
+        ))
+
+    # Configure the chart layout
+    fig.update_layout(
+        title="System Metrics Over Time",
+        xaxis_title="Time",
+        yaxis_title="Value",
+        template="plotly_white",  # Clean, white background theme
+        legend=dict(x=0, y=1.1, orientation="h")  # Horizontal legend at top
+    )
+    return fig
+
+# Reuse the last figure while the history is unchanged (e.g. reruns while paused)
+# so identical histories skip rebuilding the Plotly traces
+if (st.session_state.get("fig_sim") is not sim
+        or st.session_state.get("fig_len") != len(sim.time_history)):
+    st.session_state.fig = build_figure(sim)
+    st.session_state.fig_sim = sim
+    st.session_state.fig_len = len(sim.time_history)
+fig = st.session_state.fig
 
 # Display the chart in the main area
 st.plotly_chart(fig, use_container_width=True)
@@ -186,12 +211,14 @@ if st.sidebar.checkbox("Show Calculation Verification", value=False):
 # ------------------ Simulation Loop ------------------
 # This section handles the automatic advancement of the simulation
 if st.session_state.running:
-    # Advance the simulation by one time step
-    step_success = sim.step()  # Returns False when simulation is complete
-    
-    # Stop simulation if step() indicates completion
-    if not step_success:
-        st.session_state.running = False
+    # Advance a batch of steps per rerun: each rerun re-executes the whole script,
+    # so at fast speeds several steps are processed per redraw instead of one
+    n_batch = max(1, int(0.05 / st.session_state.speed))
+    for _ in range(n_batch):
+        # Stop simulation if step() indicates completion
+        if not sim.step():  # Returns False when simulation is complete
+            st.session_state.running = False
+            break
     
     # Control simulation speed by pausing execution
     time.sleep(st.session_state.speed)
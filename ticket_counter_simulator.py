@@ -7,6 +7,8 @@ from HeapPriorityQueue import HeapPriorityQueue  # Custom priority queue for eve
 # ------------------ Event Class ------------------
 # Represents a discrete event in the simulation
 class Event:
+    __slots__ = "time", "event_type", "customer_id"  # No per-instance __dict__
+
     def __init__(self, time, event_type, customer_id):
         self.time = time  # When the event occurs
         self.event_type = event_type  # Type: ARRIVAL, SERVICE_START, SERVICE_END
@@ -60,12 +62,18 @@ class TicketCounterSim:
     def _schedule_initial_arrivals(self):
         """Schedule arrival events for all customers using exponential interarrival times"""
         current_time = 0
+        arrivals = []
+        # Bind loop-invariant lookups to locals once instead of per iteration
+        expovariate = random.expovariate
+        rate = self.arrival_rate
+        append = arrivals.append
         for i in range(self.num_customers):
             # Exponential distribution for interarrival times (Poisson process)
-            interarrival = random.expovariate(self.arrival_rate)
+            interarrival = expovariate(rate)
             current_time += interarrival
-            # Schedule arrival event in the future events list
-            self.future_events.add(current_time, Event(current_time, "ARRIVAL", i))
+            append((current_time, Event(current_time, "ARRIVAL", i)))
+        # Bulk-load the future events list so the heap is built once in O(n)
+        self.future_events = HeapPriorityQueue(arrivals)
 
     # ------------------ Simulation Stepping ------------------
     def step(self):